@@ -3,13 +3,20 @@
 """
 import sys
 import traceback
+import importlib
 from typing import List, Dict, Any
 
 from util.config import ConfigManager
 from util.logger import Logger
 from util.telegram_bot import TelegramNotifier
-from upbit.trader import UpbitTrader
-# from kis.trader import KisTrader
+from upbit.api import UpbitFatalError
+
+# 플랫폼별 트레이더 클래스 위치 (모듈 경로, 클래스 이름)
+# 트레이더 모듈(분석기의 numpy 등)은 실행할 플랫폼의 것만 임포트
+TRADER_CLASSES = {
+    'upbit': ('upbit.trader', 'UpbitTrader'),
+    # 'kis': ('kis.trader', 'KisTrader'),
+}
 
 def main():
     # 전역 변수로 선언하여 finally 블록에서 접근 가능하도록 함
@@ -38,8 +45,10 @@ def main():
         notifier = TelegramNotifier(platform=platform, config=config, logger=logger)
 
         # 트레이더 초기화 및 실행
-        if platform == 'upbit':
-            trader = UpbitTrader(config=config, logger=logger, notifier=notifier)
+        if platform in TRADER_CLASSES:
+            module_name, class_name = TRADER_CLASSES[platform]
+            trader_class = getattr(importlib.import_module(module_name), class_name)
+            trader = trader_class(config=config, logger=logger, notifier=notifier)
         elif platform == 'kis':
             # trader = KisTrader(config=config, logger=logger, notifier=notifier)
             logger.warning("KIS 트레이더는 아직 구현되지 않았습니다.")
@@ -61,6 +70,13 @@ def main():
         if logger and notifier:
             logger.info("사용자에 의해 프로그램이 종료되었습니다.")
             notifier.send_message("⚠️ 프로그램 종료\n" + f"{platform} {env} 프로그램이 사용자에 의해 종료되었습니다.")
+    except UpbitFatalError as e:
+        # 인증 실패 등 복구할 수 없는 API 오류 (상세 알림은 API 모듈에서 이미 전송됨)
+        if logger:
+            logger.critical(f"복구할 수 없는 API 오류로 프로그램을 종료합니다: {str(e)}")
+        else:
+            print(f"복구할 수 없는 API 오류로 프로그램을 종료합니다: {str(e)}", file=sys.stderr)
+        sys.exit(1)
     except Exception as e:
         # 상세한 예외 정보 수집
         error_traceback = traceback.format_exc()
@@ -0,0 +1,151 @@
+"""
+스트리밍 지표 검증
+
+StreamingIndicators의 O(1) 갱신 결과를 전체 종가로 매번 다시 계산한 값과 비교
+"""
+import logging
+import math
+from typing import Dict, List
+
+import numpy as np
+import pytest
+
+from upbit.analyzer import StreamingIndicators, UpbitAnalyzer, _macd
+
+
+def reference_metrics(closes: List[float]) -> Dict[str, float]:
+    """
+    전체 종가로 기술적 지표를 처음부터 계산 (단순 구현)
+
+    Args:
+        closes: 시간순 종가 리스트 (스트림 시작부터 전체)
+
+    Returns:
+        StreamingIndicators.metrics()와 같은 형식의 지표 딕셔너리
+    """
+    close = np.asarray(closes, dtype=np.float64)
+
+    # RSI: 최근 14개 변화량의 상승폭/하락폭 단순 평균
+    deltas = np.diff(close[-15:])
+    gain = deltas[deltas > 0].sum()
+    loss = -deltas[deltas < 0].sum()
+    rsi = 100.0 - 100.0 / (1.0 + gain / loss) if loss > 0 else 100.0
+
+    # MACD: 첫 종가로 초기화한 EMA를 봉마다 순서대로 갱신
+    ema_fast = ema_slow = close[0]
+    ema_signal = 0.0
+    for i, value in enumerate(close):
+        ema_fast += (value - ema_fast) * 2.0 / 13
+        ema_slow += (value - ema_slow) * 2.0 / 27
+        macd = ema_fast - ema_slow
+        ema_signal = macd if i == 0 else ema_signal + (macd - ema_signal) * 2.0 / 10
+
+    ma20 = close[-20:].mean()
+    std20 = close[-20:].std(ddof=1)
+
+    return {
+        'current_price': close[-1],
+        'rsi': rsi,
+        'macd': ema_fast - ema_slow,
+        'macd_signal': ema_signal,
+        'bb_upper': ma20 + 2 * std20,
+        'bb_lower': ma20 - 2 * std20,
+        'ma20': ma20,
+        'ma50': close[-50:].mean() if len(close) >= 50 else np.nan,
+        'ma200': close[-200:].mean() if len(close) >= 200 else np.nan
+    }
+
+
+def assert_metrics_close(actual: Dict[str, float], expected: Dict[str, float]):
+    """지표 딕셔너리의 모든 값이 상대 오차 1e-9 이내인지 확인 (NaN은 NaN끼리 일치)"""
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if math.isnan(value):
+            assert math.isnan(actual[key]), key
+        else:
+            assert actual[key] == pytest.approx(value, rel=1e-9, abs=1e-6), key
+
+
+def make_closes(count: int, seed: int = 0) -> List[float]:
+    """1억원 안팎의 무작위 종가 시계열 생성"""
+    rng = np.random.default_rng(seed)
+    return list(1.4e8 * np.exp(np.cumsum(rng.normal(0, 0.02, count))))
+
+
+class Config:
+    """기본값만 반환하는 설정"""
+
+    def get(self, key, default=None):
+        return default
+
+
+class FakeAPI:
+    """종가 리스트를 Upbit 캔들 응답(최신 봉이 먼저) 형식으로 반환하는 API"""
+
+    def __init__(self, closes: List[float]):
+        self.closes = list(closes)
+        self.counts: List[int] = []
+
+    def get_candles(self, market: str, interval: str = "1d", count: int = 200, to=None) -> List[Dict]:
+        self.counts.append(count)
+        start = max(0, len(self.closes) - count)
+        candles = [
+            {'market': market, 'candle_date_time_utc': f"T{i:06d}", 'trade_price': self.closes[i]}
+            for i in range(start, len(self.closes))
+        ]
+        return candles[::-1]
+
+
+def test_from_closes_matches_reference():
+    closes = make_closes(250)
+    assert_metrics_close(StreamingIndicators.from_closes(np.array(closes)).metrics(), reference_metrics(closes))
+
+
+def test_from_closes_macd_matches_batch_kernel():
+    closes = np.array(make_closes(100))
+    macd, macd_signal, _ = _macd(closes, 12, 26, 9)
+    metrics = StreamingIndicators.from_closes(closes).metrics()
+    assert metrics['macd'] == pytest.approx(macd[-1], rel=1e-9)
+    assert metrics['macd_signal'] == pytest.approx(macd_signal[-1], rel=1e-9)
+
+
+def test_update_and_replace_last_match_reference():
+    closes = make_closes(400, seed=1)
+    history = closes[:30]
+    indicators = StreamingIndicators.from_closes(np.array(history))
+    rng = np.random.default_rng(2)
+
+    for close in closes[30:]:
+        # 진행 중인 봉의 종가를 몇 번 바꾼 뒤 새 봉 추가
+        for _ in range(rng.integers(0, 3)):
+            history[-1] *= 1 + rng.uniform(-0.02, 0.02)
+            assert_metrics_close(indicators.replace_last(history[-1]), reference_metrics(history))
+        history.append(close)
+        assert_metrics_close(indicators.update(close), reference_metrics(history))
+
+
+def test_streaming_metrics_same_bar_new_bar_and_gap():
+    closes = make_closes(400, seed=3)
+    api = FakeAPI(closes[:150])
+    analyzer = UpbitAnalyzer(api, logging.getLogger(__name__), Config())
+    start = 150 - analyzer.candle_count
+
+    assert_metrics_close(analyzer._get_technical_metrics('KRW-BTC'), reference_metrics(api.closes[start:]))
+    assert api.counts == [analyzer.candle_count]
+
+    # 같은 봉 진행 중: 최근 2개 봉만 조회하여 종가 교체
+    api.closes[-1] *= 1.01
+    assert_metrics_close(analyzer._get_technical_metrics('KRW-BTC'), reference_metrics(api.closes[start:]))
+
+    # 새 봉 시작: 직전 봉 종가 확정 후 새 봉 추가
+    api.closes[-1] *= 0.995
+    api.closes.append(closes[150])
+    assert_metrics_close(analyzer._get_technical_metrics('KRW-BTC'), reference_metrics(api.closes[start:]))
+    assert api.counts[1:] == [2, 2]
+
+    # 봉 누락: 전체 재계산
+    api.closes.extend(closes[151:154])
+    expected = reference_metrics(api.closes[-analyzer.candle_count:])
+    assert_metrics_close(analyzer._get_technical_metrics('KRW-BTC'), expected)
+    assert api.counts[3:] == [2, analyzer.candle_count]
+    assert_metrics_close(analyzer._streams['KRW-BTC'][1].metrics(), expected)
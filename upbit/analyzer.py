@@ -2,11 +2,352 @@
 Upbit 시장 분석 모듈
 """
 from typing import Dict, List, Optional, Any, Tuple
-import pandas as pd
+import time
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from datetime import datetime, timedelta
 
-from upbit.api import UpbitAPI
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba 미설치 환경에서는 데코레이터를 무시하고 순수 파이썬으로 실행
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    
+    prange = range
+
+from upbit.api import UpbitAPI, UpbitFatalError
+
+
+def _rsi(close: np.ndarray, period: int) -> np.ndarray:
+    """
+    마지막 봉의 RSI 계산 (기간 내 상승폭/하락폭 단순 평균 방식)
+    
+    마지막 period 개 변화량만 사용하여 전체 구간을 계산하지 않음
+    
+    Args:
+        close: 종가 배열 (float64, 2차원이면 행별로 계산)
+        period: RSI 기간
+        
+    Returns:
+        마지막 봉의 RSI (2차원 입력이면 행별 값 배열, 계산 불가 시 NaN)
+    """
+    if close.shape[-1] < period:
+        return np.full(close.shape[:-1], np.nan)
+        
+    # 봉 개수가 period 와 같으면 첫 봉의 변화량(0)은 합계에 영향이 없으므로 제외
+    delta = np.diff(close[..., -(period + 1):], axis=-1)
+    gain_sum = np.maximum(delta, 0.0).sum(axis=-1)
+    loss_sum = np.maximum(-delta, 0.0).sum(axis=-1)
+    
+    # 하락폭 합계가 0이면 RSI 100, 상승폭/하락폭 모두 0이면 NaN
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+
+
+@njit('UniTuple(f8[::1], 3)(f8[:], i8, i8, i8)', cache=True, nogil=True, fastmath=True)
+def _macd(close: np.ndarray, fast: int, slow: int, signal: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD 계산
+    
+    단기/장기 EMA와 시그널 EMA를 한 번의 순회로 함께 갱신
+    
+    Args:
+        close: 종가 배열 (float64)
+        fast: 단기 EMA 기간
+        slow: 장기 EMA 기간
+        signal: 시그널 EMA 기간
+        
+    Returns:
+        (MACD, 시그널, 히스토그램) 배열 튜플
+    """
+    n = close.shape[0]
+    macd = np.empty(n)
+    macd_signal = np.empty(n)
+    hist = np.empty(n)
+    
+    alpha_fast = 2.0 / (fast + 1)
+    alpha_slow = 2.0 / (slow + 1)
+    alpha_signal = 2.0 / (signal + 1)
+    
+    ema_fast = close[0]
+    ema_slow = close[0]
+    ema_signal = 0.0
+    
+    for i in range(n):
+        ema_fast += alpha_fast * (close[i] - ema_fast)
+        ema_slow += alpha_slow * (close[i] - ema_slow)
+        m = ema_fast - ema_slow
+        ema_signal += alpha_signal * (m - ema_signal)
+        macd[i] = m
+        macd_signal[i] = ema_signal
+        hist[i] = m - ema_signal
+        
+    return macd, macd_signal, hist
+
+
+# 사용할 때 컴파일 (parallel 컴파일은 오래 걸리므로 임포트 시점에 미리 하지 않음)
+@njit(cache=True, nogil=True, parallel=True)
+def _macd_batch(closes: np.ndarray, fast: int, slow: int, signal: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    여러 마켓의 MACD를 한 번에 계산
+    
+    마켓(행)마다 독립적으로 _macd 를 수행하며, 행 단위로 여러 코어에 분배
+    
+    Args:
+        closes: 마켓별 종가 2차원 배열 (마켓 수 x 봉 수)
+        fast: 단기 EMA 기간
+        slow: 장기 EMA 기간
+        signal: 시그널 EMA 기간
+        
+    Returns:
+        (MACD, 시그널, 히스토그램) 2차원 배열 튜플
+    """
+    macd = np.empty(closes.shape)
+    macd_signal = np.empty(closes.shape)
+    hist = np.empty(closes.shape)
+    
+    for row in prange(closes.shape[0]):
+        macd[row], macd_signal[row], hist[row] = _macd(closes[row], fast, slow, signal)
+        
+    return macd, macd_signal, hist
+
+
+class StreamingIndicators:
+    """
+    종가가 한 봉씩 추가될 때마다 기술적 지표를 O(1)로 갱신하는 클래스
+    
+    전체 구간을 다시 계산하지 않고 이동 구간 합계와 EMA 상태만 유지
+    """
+    
+    def __init__(self, rsi_period: int = 14, macd_fast: int = 12, macd_slow: int = 26, macd_signal: int = 9,
+                 ma_periods: Tuple[int, ...] = (20, 50, 200), bb_period: int = 20):
+        """
+        스트리밍 지표 초기화
+        
+        Args:
+            rsi_period: RSI 기간
+            macd_fast: MACD 단기 EMA 기간
+            macd_slow: MACD 장기 EMA 기간
+            macd_signal: MACD 시그널 EMA 기간
+            ma_periods: 이동평균 기간 목록
+            bb_period: 볼린저 밴드 기간
+        """
+        self.rsi_period = rsi_period
+        self.ma_periods = ma_periods
+        self.bb_period = bb_period
+        
+        self.count = 0
+        self.last_close = 0.0
+        
+        # 마지막 봉 반영 직전 상태 (진행 중인 봉의 종가 교체용)
+        self._prev_close = 0.0
+        self._prev_ema = (0.0, 0.0, 0.0)
+        
+        # RSI 상태 (최근 변화량과 상승폭/하락폭 합계)
+        self._deltas: deque = deque(maxlen=rsi_period)
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        
+        # MACD 상태
+        self._alpha_fast = 2.0 / (macd_fast + 1)
+        self._alpha_slow = 2.0 / (macd_slow + 1)
+        self._alpha_signal = 2.0 / (macd_signal + 1)
+        self._ema_fast = 0.0
+        self._ema_slow = 0.0
+        self._ema_signal = 0.0
+        
+        # 이동평균 상태 (기간별 최근 종가와 합계)
+        periods = set(ma_periods) | {bb_period}
+        self._windows: Dict[int, deque] = {period: deque(maxlen=period) for period in periods}
+        self._sums: Dict[int, float] = {period: 0.0 for period in periods}
+        
+        # 볼린저 밴드 상태 (Welford 방식 구간 평균과 편차 제곱합)
+        self._bb_mean = 0.0
+        self._bb_m2 = 0.0
+    
+    @classmethod
+    def from_closes(cls, closes: np.ndarray, **kwargs) -> 'StreamingIndicators':
+        """
+        과거 종가로 상태를 채운 스트리밍 지표 생성
+        
+        Args:
+            closes: 시간순 종가 배열
+            **kwargs: 지표 기간 설정 (__init__ 인자)
+            
+        Returns:
+            과거 종가가 반영된 스트리밍 지표 객체
+        """
+        indicators = cls(**kwargs)
+        for close in closes:
+            indicators.update(float(close))
+        return indicators
+    
+    def update(self, close: float) -> Dict[str, float]:
+        """
+        새 봉의 종가를 반영하여 지표 갱신
+        
+        Args:
+            close: 새 봉의 종가
+            
+        Returns:
+            갱신된 기술적 지표 딕셔너리 (계산 불가 지표는 NaN)
+        """
+        # RSI: 첫 봉은 이전 종가가 없으므로 변화량 0
+        delta = close - self.last_close if self.count > 0 else 0.0
+        if len(self._deltas) == self.rsi_period:
+            self._apply_delta(self._deltas[0], -1.0)
+        self._deltas.append(delta)
+        self._apply_delta(delta)
+            
+        # MACD
+        self._prev_close = self.last_close
+        self._prev_ema = (self._ema_fast, self._ema_slow, self._ema_signal)
+        self._step_ema(close)
+        
+        # 볼린저 밴드: 구간이 가득 차면 가장 오래된 종가와 교체, 아니면 추가
+        bb_window = self._windows[self.bb_period]
+        if len(bb_window) == self.bb_period:
+            self._swap_bb(bb_window[0], close, self.bb_period)
+        else:
+            delta = close - self._bb_mean
+            self._bb_mean += delta / (len(bb_window) + 1)
+            self._bb_m2 += delta * (close - self._bb_mean)
+            
+        # 이동평균
+        for period, window in self._windows.items():
+            if len(window) == period:
+                self._sums[period] -= window[0]
+            window.append(close)
+            self._sums[period] += close
+                
+        self.count += 1
+        self.last_close = close
+        
+        return self.metrics()
+    
+    def replace_last(self, close: float) -> Dict[str, float]:
+        """
+        마지막 봉의 종가를 교체하여 지표 갱신 (진행 중인 봉의 현재가 반영)
+        
+        Args:
+            close: 마지막 봉의 새 종가
+            
+        Returns:
+            갱신된 기술적 지표 딕셔너리 (계산 불가 지표는 NaN)
+        """
+        if self.count == 0:
+            return self.update(close)
+            
+        # RSI: 마지막 변화량을 새 종가 기준으로 교체
+        delta = close - self._prev_close if self.count > 1 else 0.0
+        self._apply_delta(self._deltas[-1], -1.0)
+        self._deltas[-1] = delta
+        self._apply_delta(delta)
+        
+        # MACD: 마지막 봉 반영 전 상태에서 다시 갱신
+        self._ema_fast, self._ema_slow, self._ema_signal = self._prev_ema
+        self.count -= 1
+        self._step_ema(close)
+        self.count += 1
+        
+        # 볼린저 밴드 / 이동평균: 마지막 종가 교체
+        bb_window = self._windows[self.bb_period]
+        self._swap_bb(bb_window[-1], close, len(bb_window))
+        for period, window in self._windows.items():
+            self._sums[period] += close - window[-1]
+            window[-1] = close
+            
+        self.last_close = close
+        
+        return self.metrics()
+    
+    def _apply_delta(self, delta: float, sign: float = 1.0):
+        """
+        RSI 상승폭/하락폭 합계에 변화량 반영
+        
+        Args:
+            delta: 종가 변화량
+            sign: 1.0이면 추가, -1.0이면 제거
+        """
+        if delta > 0:
+            self._gain_sum += sign * delta
+        else:
+            self._loss_sum -= sign * delta
+    
+    def _swap_bb(self, old: float, new: float, size: int):
+        """
+        볼린저 밴드 구간의 종가 하나를 교체하여 평균과 편차 제곱합 갱신 (Welford 방식)
+        
+        제곱합 차이로 분산을 구할 때 생기는 자릿수 손실 없이 O(1)로 갱신
+        
+        Args:
+            old: 구간에서 빠지는 종가
+            new: 구간에 들어오는 종가
+            size: 구간 내 종가 개수
+        """
+        old_mean = self._bb_mean
+        self._bb_mean += (new - old) / size
+        self._bb_m2 += (new - old) * (new - self._bb_mean + old - old_mean)
+    
+    def _step_ema(self, close: float):
+        """
+        MACD EMA 상태를 한 봉 갱신 (첫 봉은 종가로 초기화)
+        
+        Args:
+            close: 종가
+        """
+        if self.count == 0:
+            self._ema_fast = close
+            self._ema_slow = close
+        self._ema_fast += self._alpha_fast * (close - self._ema_fast)
+        self._ema_slow += self._alpha_slow * (close - self._ema_slow)
+        macd = self._ema_fast - self._ema_slow
+        self._ema_signal += self._alpha_signal * (macd - self._ema_signal)
+    
+    def metrics(self) -> Dict[str, float]:
+        """
+        현재 상태의 기술적 지표 반환
+        
+        Returns:
+            기술적 지표 딕셔너리 (계산 불가 지표는 NaN)
+        """
+        rsi = np.nan
+        if self.count >= self.rsi_period:
+            if self._loss_sum > 0:
+                rsi = 100.0 - 100.0 / (1.0 + self._gain_sum / self._loss_sum)
+            elif self._gain_sum > 0:
+                rsi = 100.0
+                
+        mas = {}
+        for period in self._windows:
+            mas[period] = self._sums[period] / period if self.count >= period else np.nan
+            
+        bb_upper = bb_lower = np.nan
+        period = self.bb_period
+        if self.count >= period:
+            ma = mas[period]
+            variance = max(self._bb_m2 / (period - 1), 0.0)
+            std = variance ** 0.5
+            bb_upper = ma + 2 * std
+            bb_lower = ma - 2 * std
+            
+        metrics = {
+            'current_price': self.last_close,
+            'rsi': rsi,
+            'macd': self._ema_fast - self._ema_slow,
+            'macd_signal': self._ema_signal,
+            'bb_upper': bb_upper,
+            'bb_lower': bb_lower
+        }
+        for period in self.ma_periods:
+            metrics[f'ma{period}'] = mas[period]
+            
+        return metrics
 
 
 class UpbitAnalyzer:
@@ -31,8 +372,27 @@ class UpbitAnalyzer:
         self.stop_loss_percent = self.config.get('risk.stop_loss_percent', 3.0)
         self.stop_loss_percent_high = self.config.get('risk.stop_loss_percent_high', 2.0)
         
+        # 기술적 지표 기간 설정
+        self.rsi_period = self.config.get('strategy.rsi_period', 14)
+        self.macd_fast = self.config.get('strategy.macd_fast', 12)
+        self.macd_slow = self.config.get('strategy.macd_slow', 26)
+        self.macd_signal = self.config.get('strategy.macd_signal', 9)
+        
+        # 지표 계산용 캔들 개수 (봉 수가 기간보다 부족한 장기 이동평균(ma200)은 계산하지 않고 NaN 반환)
+        self.candle_count = 100
+        
+        # 캔들 종가 캐시 ((마켓, 간격, 개수) -> (조회 시각, 종가 배열))
+        self.candle_cache_ttl = self.config.get('strategy.candle_cache_ttl', 30)
+        self._candle_cache: Dict[Tuple[str, str, int], Tuple[float, np.ndarray]] = {}
+        
+        # 마켓별 스트리밍 지표 상태 (마켓 -> (마지막 봉 시각, 지표 상태))
+        self._streams: Dict[str, Tuple[str, StreamingIndicators]] = {}
+        
+        # 여러 마켓 동시 분석 시 작업 스레드 수
+        self.max_workers = self.config.get('strategy.max_workers', 4)
+        
         if self.logger:
-            self.logger.info(f"리스크 관리 파라미터 설정 - 기본 손절: {self.stop_loss_percent}%, 최고가 대비 손절: {self.stop_loss_percent_high}%")
+            self.logger.info("리스크 관리 파라미터 설정 - 기본 손절: %s%%, 최고가 대비 손절: %s%%", self.stop_loss_percent, self.stop_loss_percent_high)
     
     def run_trading_analyzer(self, market: str = "KRW-BTC") -> bool:
         """
@@ -49,7 +409,7 @@ class UpbitAnalyzer:
             # 기술적 지표 계산
             metrics = self._get_technical_metrics(market)
             if not metrics:
-                self.logger.error(f"{market} 기술적 지표 계산 실패")
+                self.logger.error("%s 기술적 지표 계산 실패", market)
                 return False
             
             # 매수 조건 확인 (예시)
@@ -64,16 +424,60 @@ class UpbitAnalyzer:
             market_korean_name = self.api.get_market_name().get(market, market)
             
             if buy_signal:
-                self.logger.info(f"{market}({market_korean_name}) 매수 시그널 발생: RSI={rsi:.2f}, MACD={macd:.2f}, MACD_SIGNAL={macd_signal:.2f}")
+                self.logger.info("%s(%s) 매수 시그널 발생: RSI=%.2f, MACD=%.2f, MACD_SIGNAL=%.2f", market, market_korean_name, rsi, macd, macd_signal)
             else:
-                self.logger.info(f"{market}({market_korean_name}) 매수 시그널 발생 안됨 - RSI={rsi:.2f}, MACD={macd:.2f}, MACD_SIGNAL={macd_signal:.2f}")
+                self.logger.info("%s(%s) 매수 시그널 발생 안됨 - RSI=%.2f, MACD=%.2f, MACD_SIGNAL=%.2f", market, market_korean_name, rsi, macd, macd_signal)
             
             return buy_signal
             
         except Exception as e:
-            self.logger.error(f"매매 전략 분석 중 오류 발생: {str(e)}")
+            self.logger.error("매매 전략 분석 중 오류 발생: %s", e)
             return False
     
+    def analyze_markets(self, markets: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        여러 마켓의 기술적 지표를 한 번에 계산
+        
+        캔들 조회(네트워크 대기)는 스레드 풀에서 마켓별로 동시에 수행하고,
+        봉 개수가 같은 마켓끼리 (마켓 수 x 봉 수) 배열로 묶어 지표를 한 번에 계산
+        
+        Args:
+            markets: 마켓 코드 리스트 (예: ['KRW-BTC', 'KRW-ETH'])
+            
+        Returns:
+            마켓별 기술적 지표 딕셔너리 (계산 실패한 마켓은 제외)
+        """
+        count = self.candle_count
+        
+        def fetch(market: str) -> Optional[np.ndarray]:
+            try:
+                return self._get_close_prices(market, interval="1d", count=count)
+            except UpbitFatalError:
+                raise
+            except Exception as e:
+                self.logger.error("%s 캔들 데이터 조회 중 오류 발생: %s", market, e)
+                return None
+                
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            closes = dict(zip(markets, executor.map(fetch, markets)))
+            
+        # 봉 개수별로 마켓 묶기 (상장 기간이 짧은 마켓도 같은 길이끼리 묶어서 계산)
+        groups: Dict[int, List[str]] = {}
+        for market, close in closes.items():
+            if close is None:
+                self.logger.error("%s 캔들 데이터 조회 실패", market)
+            else:
+                groups.setdefault(close.shape[0], []).append(market)
+                
+        result = {}
+        for group in groups.values():
+            metrics = self._calculate_metrics(np.stack([closes[market] for market in group]))
+            for row, market in enumerate(group):
+                result[market] = {key: float(values[row]) for key, values in metrics.items()}
+                
+        # 요청한 마켓 순서대로 반환
+        return {market: result[market] for market in markets if market in result}
+    
     def check_stop_loss_condition(self, position: Dict[str, Any]) -> bool:
         """
         손절 조건 체크
@@ -92,13 +496,13 @@ class UpbitAnalyzer:
                 
             entry_price = position.get('entry_price', 0)
             if entry_price <= 0:
-                self.logger.warning(f"{market} 손절 조건 체크: 진입 가격이 유효하지 않습니다. (진입가: {entry_price})")
+                self.logger.warning("%s 손절 조건 체크: 진입 가격이 유효하지 않습니다. (진입가: %s)", market, entry_price)
                 return False
                 
             # 현재가 조회
             current_price_info = self.api.get_current_price(market)
             if not current_price_info:
-                self.logger.error(f"{market} 현재가 조회 실패")
+                self.logger.error("%s 현재가 조회 실패", market)
                 return False
                 
             current_price = float(current_price_info.get('trade_price', 0))
@@ -120,20 +524,22 @@ class UpbitAnalyzer:
             stop_loss = loss_rate <= self.stop_loss_percent
             stop_loss_from_high = high_loss_rate <= self.stop_loss_percent_high
             
-            market_korean_name = self.api.get_market_name().get(market, market)
-            change_emoji = "📈" if loss_rate > 0 else "📉"
-            value_krw = position.get('value_krw', 0)
-            if stop_loss:
-                self.logger.info(f"{market} ({market_korean_name}) {change_emoji} 기본 손절 조건 충족: 손실률={loss_rate:.2f}%, 평가금액={value_krw:,.0f}원")
-            elif stop_loss_from_high:
-                self.logger.info(f"{market} ({market_korean_name}) {change_emoji} 최고가 대비 손절 조건 충족: 최고가 대비 하락률={high_loss_rate:.2f}%, 평가금액={value_krw:,.0f}원")
-            else:
-                self.logger.info(f"{market} ({market_korean_name}) {change_emoji} 평가금액={value_krw:,.0f}원 수익률: {loss_rate:.2f}%, 최고가 대비 하락률 ( 1% 이상 ) : {high_loss_rate:.2f}%")
+            # 로그용 이름 조회와 금액 서식 처리는 INFO 로그가 켜진 경우에만 수행
+            if self.logger.isEnabledFor(logging.INFO):
+                market_korean_name = self.api.get_market_name().get(market, market)
+                change_emoji = "📈" if loss_rate > 0 else "📉"
+                value_krw = position.get('value_krw', 0)
+                if stop_loss:
+                    self.logger.info(f"{market} ({market_korean_name}) {change_emoji} 기본 손절 조건 충족: 손실률={loss_rate:.2f}%, 평가금액={value_krw:,.0f}원")
+                elif stop_loss_from_high:
+                    self.logger.info(f"{market} ({market_korean_name}) {change_emoji} 최고가 대비 손절 조건 충족: 최고가 대비 하락률={high_loss_rate:.2f}%, 평가금액={value_krw:,.0f}원")
+                else:
+                    self.logger.info(f"{market} ({market_korean_name}) {change_emoji} 평가금액={value_krw:,.0f}원 수익률: {loss_rate:.2f}%, 최고가 대비 하락률 ( 1% 이상 ) : {high_loss_rate:.2f}%")
 
             return stop_loss or stop_loss_from_high
             
         except Exception as e:
-            self.logger.error(f"손절 조건 체크 중 오류 발생: {str(e)}")
+            self.logger.error("손절 조건 체크 중 오류 발생: %s", e)
             return False
 
     def _get_technical_metrics(self, market: str = "KRW-BTC", retry_count: int = 3) -> Dict[str, float]:
@@ -149,65 +555,161 @@ class UpbitAnalyzer:
         """
         for attempt in range(retry_count):
             try:
-                # 캔들 데이터 조회
-                candles = self.api.get_candles(market, interval="1d", count=100)
-                if not candles:
-                    self.logger.error(f"{market} 캔들 데이터 조회 실패 (시도 {attempt+1}/{retry_count})")
+                metrics = self._get_streaming_metrics(market, interval="1d", count=self.candle_count)
+                if metrics is None:
+                    self.logger.error("%s 캔들 데이터 조회 실패 (시도 %d/%d)", market, attempt + 1, retry_count)
                     continue
                     
-                # 데이터프레임 변환
-                df = pd.DataFrame(candles)
-                df = df.sort_values(by='candle_date_time_utc')
-                
-                # 필요한 컬럼만 추출
-                df['close'] = df['trade_price'].astype(float)
-                df['high'] = df['high_price'].astype(float)
-                df['low'] = df['low_price'].astype(float)
-                df['open'] = df['opening_price'].astype(float)
-                df['volume'] = df['candle_acc_trade_volume'].astype(float)
-                
-                # 현재가
-                current_price = float(df['close'].iloc[-1])
-                
-                # RSI 계산 (14일)
-                delta = df['close'].diff()
-                gain = delta.where(delta > 0, 0)
-                loss = -delta.where(delta < 0, 0)
-                avg_gain = gain.rolling(window=14).mean()
-                avg_loss = loss.rolling(window=14).mean()
-                rs = avg_gain / avg_loss
-                rsi = 100 - (100 / (1 + rs))
-                
-                # MACD 계산
-                exp1 = df['close'].ewm(span=12, adjust=False).mean()
-                exp2 = df['close'].ewm(span=26, adjust=False).mean()
-                macd = exp1 - exp2
-                signal = macd.ewm(span=9, adjust=False).mean()
-                
-                # 볼린저 밴드 계산 (20일, 2표준편차)
-                ma20 = df['close'].rolling(window=20).mean()
-                std20 = df['close'].rolling(window=20).std()
-                bb_upper = ma20 + 2 * std20
-                bb_lower = ma20 - 2 * std20
+                return metrics
                 
-                # 이동평균선 계산
-                ma20 = df['close'].rolling(window=20).mean()
-                ma50 = df['close'].rolling(window=50).mean()
-                ma200 = df['close'].rolling(window=200).mean()
+            except ValueError as e:
+                # 응답 데이터 형식 오류는 같은 요청을 반복해도 해결되지 않으므로 재시도하지 않음
+                self.logger.error("%s 기술적 지표 계산 중 데이터 오류 발생: %s", market, e)
+                return {}
+            except Exception as e:
+                self.logger.error("%s 기술적 지표 계산 중 오류 발생: %s (시도 %d/%d)", market, e, attempt + 1, retry_count)
                 
-                return {
-                    'current_price': current_price,
-                    'rsi': rsi.iloc[-1],
-                    'macd': macd.iloc[-1],
-                    'macd_signal': signal.iloc[-1],
-                    'bb_upper': bb_upper.iloc[-1],
-                    'bb_lower': bb_lower.iloc[-1],
-                    'ma20': ma20.iloc[-1],
-                    'ma50': ma50.iloc[-1],
-                    'ma200': ma200.iloc[-1]
-                }
+        return {} 
+
+    def _get_streaming_metrics(self, market: str, interval: str = "1d", count: int = 100) -> Optional[Dict[str, float]]:
+        """
+        마켓별 스트리밍 지표 갱신
+        
+        이전 분석 상태가 있으면 최근 2개 봉만 조회하여 진행 중인 봉의 종가 교체
+        또는 새 봉 추가를 O(1)로 반영하고, 최초 분석이거나 봉 누락이 감지되면
+        count 개 봉으로 전체 재계산
+        
+        Args:
+            market: 마켓 코드 (예: KRW-BTC)
+            interval: 캔들 간격
+            count: 전체 재계산 시 캔들 개수
+            
+        Returns:
+            기술적 지표 딕셔너리. 조회 실패 시 None
+        """
+        stream = self._streams.get(market)
+        if stream is not None:
+            last_time, indicators = stream
+            candles = self.api.get_candles(market, interval=interval, count=2)
+            if not candles:
+                return None
+            # 시간순 종가 배열 (응답 순서 검증 포함, 마지막 값이 최신 봉)
+            closes = self._to_close_array(candles)
+            latest = candles[0]
+            
+            # 같은 봉 진행 중: 종가만 교체
+            if latest['candle_date_time_utc'] == last_time:
+                return indicators.replace_last(float(closes[-1]))
                 
-            except Exception as e:
-                self.logger.error(f"{market} 기술적 지표 계산 중 오류 발생: {str(e)} (시도 {attempt+1}/{retry_count})")
+            # 새 봉 시작: 직전 봉 종가 확정 후 새 봉 추가
+            if len(candles) == 2 and candles[1]['candle_date_time_utc'] == last_time:
+                indicators.replace_last(float(closes[0]))
+                metrics = indicators.update(float(closes[-1]))
+                self._streams[market] = (latest['candle_date_time_utc'], indicators)
+                return metrics
                 
-        return {} 
\ No newline at end of file
+            self.logger.debug("%s 봉 누락 감지 (%s -> %s), 전체 재계산", market, last_time, latest['candle_date_time_utc'])
+            
+        candles = self.api.get_candles(market, interval=interval, count=count)
+        if not candles:
+            return None
+            
+        indicators = StreamingIndicators.from_closes(
+            self._to_close_array(candles),
+            rsi_period=self.rsi_period,
+            macd_fast=self.macd_fast,
+            macd_slow=self.macd_slow,
+            macd_signal=self.macd_signal
+        )
+        self._streams[market] = (candles[0]['candle_date_time_utc'], indicators)
+        return indicators.metrics()
+
+    def _calculate_metrics(self, close: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        종가 배열로 기술적 지표 계산
+        
+        Args:
+            close: 시간순 종가 배열 (2차원이면 마켓(행)별로 계산)
+            
+        Returns:
+            지표별 마지막 봉의 값 (2차원 입력이면 마켓별 값 배열)
+        """
+        # RSI 계산
+        rsi = _rsi(close, self.rsi_period)
+        
+        # MACD 계산
+        if close.ndim == 1:
+            macd, signal, _ = _macd(close, self.macd_fast, self.macd_slow, self.macd_signal)
+        else:
+            macd, signal, _ = _macd_batch(close, self.macd_fast, self.macd_slow, self.macd_signal)
+            
+        # 이동평균선 계산 (마지막 봉 값만 필요하므로 최근 구간만 평균, 봉 개수 부족 시 NaN)
+        n = close.shape[-1]
+        missing = np.full(close.shape[:-1], np.nan)
+        mas = {period: close[..., -period:].mean(axis=-1) if n >= period else missing for period in (20, 50, 200)}
+        
+        # 볼린저 밴드 계산 (20일, 2표준편차)
+        std20 = close[..., -20:].std(axis=-1, ddof=1) if n >= 20 else missing
+        bb_upper = mas[20] + 2 * std20
+        bb_lower = mas[20] - 2 * std20
+        
+        return {
+            'current_price': close[..., -1],
+            'rsi': rsi,
+            'macd': macd[..., -1],
+            'macd_signal': signal[..., -1],
+            'bb_upper': bb_upper,
+            'bb_lower': bb_lower,
+            'ma20': mas[20],
+            'ma50': mas[50],
+            'ma200': mas[200]
+        }
+    
+    def _get_close_prices(self, market: str, interval: str = "1d", count: int = 100) -> Optional[np.ndarray]:
+        """
+        캔들 종가 조회
+        
+        캔들 리스트를 한 번 순회하며 종가만 float64 배열로 변환
+        캐시 유효 시간 내 동일 요청은 API 호출과 변환 없이 캐시된 결과 반환
+        
+        Args:
+            market: 마켓 코드 (예: KRW-BTC)
+            interval: 캔들 간격
+            count: 캔들 개수
+            
+        Returns:
+            시간순 정렬된 종가 배열. 조회 실패 시 None
+        """
+        key = (market, interval, count)
+        now = time.monotonic()
+        
+        cached = self._candle_cache.get(key)
+        if cached and now - cached[0] < self.candle_cache_ttl:
+            return cached[1]
+            
+        candles = self.api.get_candles(market, interval=interval, count=count)
+        if not candles:
+            return None
+            
+        close = self._to_close_array(candles)
+        self._candle_cache[key] = (now, close)
+        return close
+    
+    @staticmethod
+    def _to_close_array(candles: List[Dict]) -> np.ndarray:
+        """
+        캔들 리스트를 시간순 종가 배열로 변환
+        
+        Args:
+            candles: Upbit 캔들 리스트
+            
+        Returns:
+            시간순 정렬된 종가 배열 (float64)
+            
+        Raises:
+            ValueError: 캔들 응답이 최신순이 아닌 경우
+        """
+        # Upbit 캔들 응답은 최신순이므로 정렬 없이 뒤집어서 시간순으로 변환
+        if candles[0]['candle_date_time_utc'] < candles[-1]['candle_date_time_utc']:
+            raise ValueError("캔들 응답이 최신순이 아닙니다")
+        return np.fromiter((candle['trade_price'] for candle in reversed(candles)), dtype=np.float64, count=len(candles))
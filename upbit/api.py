@@ -1,13 +1,96 @@
 """
 Upbit API 호출 모듈
 """
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import jwt
 import uuid
 import hashlib
 from urllib.parse import urlencode
-import sys
+import time
+import threading
+import logging
+import random
+from concurrent.futures import Future
+
+try:
+    from orjson import loads as json_loads, dumps as json_dumps
+except ImportError:
+    # orjson 미설치 환경에서는 표준 json 모듈 사용 (직렬화 결과는 orjson 과 같이 bytes)
+    import json
+    
+    json_loads = json.loads
+    
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+class UpbitFatalError(Exception):
+    """
+    재시도로 복구할 수 없는 API 오류 (예: 인증 실패)
+    
+    sys.exit 대신 이 예외를 발생시켜 호출 스레드와 상관없이 메인 스레드에서 정리 후 종료하도록 함
+    """
+
+
+class TokenBucket:
+    """
+    스레드 안전한 토큰 버킷 요청 속도 제한기
+    
+    초당 rate 개씩 토큰이 채워지며 최대 burst 개까지 연속 요청 허용
+    """
+    
+    def __init__(self, rate: float, burst: float):
+        """
+        토큰 버킷 초기화
+        
+        Args:
+            rate: 초당 허용 요청 수
+            burst: 최대 연속 요청 수
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self) -> float:
+        """
+        경과 시간만큼 토큰을 채움 (락을 잡은 상태에서 호출)
+        
+        Returns:
+            채운 뒤의 토큰 수
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        return self._tokens
+    
+    def acquire(self):
+        """
+        토큰 하나를 가져오고, 토큰이 부족하면 채워질 때까지 대기
+        
+        여러 스레드가 동시에 호출해도 토큰을 먼저 예약한 뒤 락 밖에서 대기하므로
+        요청 간격이 일정하게 분산됨
+        """
+        with self._lock:
+            self._tokens = self._refill() - 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            
+        if wait > 0:
+            time.sleep(wait)
+    
+    def limit(self, remaining: float):
+        """
+        서버 기준 남은 요청 수가 토큰보다 적으면 토큰 수를 줄임
+        
+        Args:
+            remaining: 서버가 알려준 현재 초의 남은 요청 수
+        """
+        with self._lock:
+            self._tokens = min(self._refill(), remaining)
 
 
 class UpbitAPI:
@@ -15,6 +98,23 @@ class UpbitAPI:
     Upbit API 호출을 담당하는 클래스
     """
     
+    # 재시도할 일시적인 서버 오류 상태 코드
+    SERVER_ERROR_STATUSES = frozenset((500, 502, 503, 504))
+    
+    # 캔들 간격별 API 경로
+    CANDLE_PATHS = {
+        '1m': '/v1/candles/minutes/1',
+        '3m': '/v1/candles/minutes/3',
+        '5m': '/v1/candles/minutes/5',
+        '15m': '/v1/candles/minutes/15',
+        '30m': '/v1/candles/minutes/30',
+        '1h': '/v1/candles/minutes/60',
+        '4h': '/v1/candles/minutes/240',
+        '1d': '/v1/candles/days',
+        '1w': '/v1/candles/weeks',
+        '1M': '/v1/candles/months'
+    }
+    
     def __init__(self, access_key: str, secret_key: str, server_url: str = "https://api.upbit.com", logger=None, notifier=None):
         """
         Upbit API 클래스 초기화
@@ -31,24 +131,78 @@ class UpbitAPI:
         self.server_url = server_url
         self.logger = logger
         self.notifier = notifier
+        
+        # JWT 페이로드 공통 부분 (요청마다 nonce, query 만 추가)
+        self._jwt_payload_base = {'access_key': self.access_key}
+        
+        # 연결 재사용(keep-alive)을 위한 세션 및 커넥션 풀
+        # 세션 수준 재시도는 연결 실패(요청이 전송되지 않은 경우)만 허용
+        # 읽기 오류/타임아웃/상태 코드 재시도는 같은 JWT(nonce)를 재전송하게 되므로 사용하지 않음
+        # 응답 압축(Accept-Encoding)은 requests 기본값 사용 (설치된 디코더에 맞춰 gzip/deflate/br 협상)
+        self.session = requests.Session()
+        self.session.headers.update({'Accept': 'application/json', 'User-Agent': 'JATS/1.0'})
+        retry = Retry(connect=3, read=0, status=0, other=0, backoff_factor=0.3)
+        # 접속 호스트는 API 서버 하나뿐이므로 호스트별 풀은 하나, 동시 연결은 최대 32개
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # 요청 타임아웃 (연결, 읽기) 초 - 응답 없는 소켓에서 트레이더가 멈추지 않도록
+        self.request_timeout = (3.05, 10)
+        
+        # HTTP 메서드별 요청 함수
+        self._senders = {
+            'GET': self.session.get,
+            'POST': self.session.post,
+            'DELETE': self.session.delete
+        }
+        
+        # 요청 속도 제한 (토큰 버킷, 시세 조회 API와 인증이 필요한 Exchange API는 제한이 따로 적용됨)
+        self._public_bucket = TokenBucket(rate=8.0, burst=8.0)
+        self._private_bucket = TokenBucket(rate=6.0, burst=6.0)
+        
+        # 429(요청 수 초과) 응답 시 지수 백오프 재시도 횟수 및 최대 대기 시간(초)
+        self.rate_limit_retries = 5
+        self.rate_limit_max_backoff = 5.0
+        # 일시적인 서버 오류(5xx) 응답 시 재시도 횟수 (주문 POST 는 중복 체결 위험이 있어 재시도하지 않음)
+        self.server_error_retries = 3
+        
+        # 진행 중인 공개 GET 요청 ((경로, 쿼리 문자열) -> 응답 Future)
+        # 같은 요청이 동시에 들어오면 HTTP 호출 한 번의 응답을 함께 사용
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # 잔고 조회 캐시 (주문/취소 시 무효화)
+        self.balance_cache_ttl = 2.0
+        self._balance_cache: Optional[List[Dict]] = None
+        self._balance_cache_time = 0.0
+        
+        # 마켓 목록/한글 이름 캐시 (마켓 목록은 신규 상장 시에만 바뀜)
+        self.market_cache_ttl = 3600.0
+        self._market_info: Optional[List[Dict]] = None
+        self._market_info_time = 0.0
+        self._market_names: Optional[Dict[str, str]] = None
+        self._market_names_source: Optional[List[Dict]] = None
     
-    def _get_auth_header(self, query_params: Optional[Dict] = None) -> Dict:
+    def close(self):
         """
-        인증 헤더 생성
+        세션의 커넥션 풀을 닫음
+        """
+        self.session.close()
+    
+    def _get_auth_header(self, query_string: str = '') -> Dict:
+        """
+        인증 헤더 생성 (주문/계좌 등 Exchange API 전용, 시세 조회 API는 인증 불필요)
         
         Args:
-            query_params: 쿼리 파라미터
+            query_string: URL 인코딩된 쿼리 문자열
             
         Returns:
             인증 헤더 딕셔너리
         """
-        payload = {
-            'access_key': self.access_key,
-            'nonce': str(uuid.uuid4())
-        }
+        payload = self._jwt_payload_base.copy()
+        payload['nonce'] = str(uuid.uuid4())
         
-        if query_params:
-            query_string = urlencode(query_params)
+        if query_string:
             payload['query'] = query_string
             
         jwt_token = jwt.encode(payload, self.secret_key)
@@ -56,6 +210,171 @@ class UpbitAPI:
         
         return {"Authorization": authorization}
     
+    def _request(self, method: str, path: str, params: Optional[Dict] = None, auth: bool = False) -> requests.Response:
+        """
+        API 요청 실행
+        
+        쿼리 문자열을 한 번만 인코딩하여 JWT 서명과 요청 URL에 함께 사용
+        인증이 필요 없는 GET 요청은 같은 경로/파라미터의 요청이 진행 중이면
+        새로 보내지 않고 진행 중인 요청의 응답을 기다려 함께 사용
+        
+        Args:
+            method: HTTP 메서드 (GET, POST, DELETE)
+            path: API 경로 (예: /v1/ticker)
+            params: 요청 파라미터 (POST는 JSON 본문)
+            auth: 인증 헤더 포함 여부
+            
+        Returns:
+            응답 객체
+        """
+        query_string = urlencode(params) if params else ''
+        if auth or method != 'GET':
+            return self._send(method, path, params, query_string, auth)
+            
+        key = (path, query_string)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+                
+        if not leader:
+            return future.result()
+            
+        try:
+            response = self._send(method, path, params, query_string, auth)
+        except BaseException as e:
+            self._finish_inflight(key)
+            future.set_exception(e)
+            raise
+            
+        self._finish_inflight(key)
+        future.set_result(response)
+        return response
+    
+    def _finish_inflight(self, key: Tuple[str, str]):
+        """
+        진행 중인 요청 목록에서 제거 (이후 들어오는 요청은 새로 전송)
+        
+        Args:
+            key: (경로, 쿼리 문자열)
+        """
+        with self._inflight_lock:
+            self._inflight.pop(key, None)
+    
+    def _send(self, method: str, path: str, params: Optional[Dict], query_string: str, auth: bool) -> requests.Response:
+        """
+        속도 제한을 적용하여 실제 HTTP 요청 전송
+        
+        Args:
+            method: HTTP 메서드 (GET, POST, DELETE)
+            path: API 경로
+            params: 요청 파라미터 (POST는 JSON 본문)
+            query_string: URL 인코딩된 쿼리 문자열
+            auth: 인증 헤더 포함 여부
+            
+        Returns:
+            응답 객체
+        """
+        url = f"{self.server_url}{path}"
+        
+        if self.logger:
+            self.logger.debug("API 요청: %s %s %s", method, url, params)
+            
+        send = self._senders[method]
+        bucket = self._private_bucket if auth else self._public_bucket
+        # 본문을 직접 직렬화(orjson)하여 requests 의 json 인코딩 과정을 생략
+        body = json_dumps(params) if method == 'POST' else None
+        
+        for attempt in range(max(self.rate_limit_retries, self.server_error_retries) + 1):
+            # nonce 는 재사용할 수 없으므로 재시도마다 인증 헤더를 새로 생성
+            headers = self._get_auth_header(query_string) if auth else None
+            bucket.acquire()
+            if method == 'POST':
+                headers = {**(headers or {}), 'Content-Type': 'application/json'}
+                response = send(url, data=body, headers=headers, timeout=self.request_timeout)
+            else:
+                response = send(url, params=query_string, headers=headers, timeout=self.request_timeout)
+                
+            self._sync_rate_limit(bucket, response)
+            status_code = response.status_code
+            if status_code == 429:
+                # 요청 수 초과: 처리되지 않은 요청이므로 주문도 재시도 가능
+                reason, retries = "요청 수 초과", self.rate_limit_retries
+            elif status_code in self.SERVER_ERROR_STATUSES and method != 'POST':
+                # 일시적인 서버 오류: 조회/취소 요청만 재시도
+                reason, retries = "서버 오류", self.server_error_retries
+            else:
+                break
+            if attempt >= retries:
+                break
+                
+            # 지수 백오프 + 지터 후 재시도
+            delay = min(0.1 * 2 ** attempt, self.rate_limit_max_backoff) + random.uniform(0, 0.1)
+            if self.logger:
+                self.logger.warning("%s(%s) - %.2f초 후 재시도 (%d/%d): %s %s", reason, status_code, delay, attempt + 1, retries, method, path)
+            time.sleep(delay)
+            
+        if self.logger:
+            self.logger.debug("API 응답 상태 코드: %s", response.status_code)
+            
+        return response
+    
+    @staticmethod
+    def _sync_rate_limit(bucket: TokenBucket, response: requests.Response):
+        """
+        응답의 Remaining-Req 헤더로 토큰 버킷을 서버의 남은 요청 수에 맞춤
+        
+        헤더 형식: group=default; min=1800; sec=29 (sec: 현재 초에 남은 요청 수)
+        서버 기준 남은 요청 수가 토큰보다 적을 때만 줄임
+        
+        Args:
+            bucket: 요청에 사용한 토큰 버킷
+            response: 응답 객체
+        """
+        remaining = response.headers.get('Remaining-Req')
+        if not remaining:
+            return
+            
+        try:
+            sec = float(remaining.rpartition('sec=')[2].split(';', 1)[0])
+        except ValueError:
+            return
+            
+        bucket.limit(sec)
+    
+    @staticmethod
+    def _decode(response: requests.Response) -> Any:
+        """
+        응답 본문(JSON) 디코딩
+        
+        텍스트 변환 없이 바이트를 바로 파싱 (orjson 미설치 시 표준 json)
+        
+        Args:
+            response: 응답 객체
+            
+        Returns:
+            디코딩된 JSON 데이터
+        """
+        return json_loads(response.content)
+    
+    def _handle_response(self, response: requests.Response, operation: str, expected: int = 200) -> Any:
+        """
+        응답 처리 (성공 시 본문 디코딩, 실패 시 공통 오류 처리)
+        
+        Args:
+            response: 응답 객체
+            operation: 수행 중이던 작업 설명
+            expected: 성공으로 판단할 HTTP 상태 코드
+            
+        Returns:
+            디코딩된 JSON 데이터. 실패 시 _handle_api_error 결과
+        """
+        if response.status_code == expected:
+            return self._decode(response)
+        return self._handle_api_error(operation, response.status_code, response.text)
+    
     def _handle_api_error(self, operation: str, status_code: int, response_text: str, error_msg: str = None):
         """
         API 오류 처리 및 알림
@@ -65,6 +384,9 @@ class UpbitAPI:
             status_code: HTTP 상태 코드
             response_text: API 응답 텍스트
             error_msg: 추가 오류 메시지
+            
+        Raises:
+            UpbitFatalError: 인증 실패(401) 등 복구할 수 없는 오류
         """
         error_message = f"{operation} 실패 - 상태 코드: {status_code}, 응답: {response_text}"
         if error_msg:
@@ -73,13 +395,15 @@ class UpbitAPI:
         if self.logger:
             self.logger.error(error_message)
             
-        # 심각한 API 오류인 경우 프로그램 종료
-        if status_code >= 500 or status_code == 401:
+        # 서버 오류(5xx)는 _send 에서 재서명 재시도(주문 POST 제외)를 마친 뒤에도 실패한 경우이므로
+        # 종료하지 않고 빈 결과 반환 (다음 주기에 다시 조회)
+        # 인증 실패(401)는 재시도로 복구되지 않으므로 예외를 발생시켜 프로그램 종료
+        if status_code == 401:
             if self.logger:
                 self.logger.critical(f"심각한 API 오류로 프로그램을 종료합니다: {error_message}")
             if self.notifier:
                 self.notifier.send_message("🔥 심각한 API 오류\n" + f"심각한 API 오류로 프로그램을 종료합니다: {error_message}")
-            sys.exit(1)
+            raise UpbitFatalError(error_message)
             
         return {}
     
@@ -94,36 +418,47 @@ class UpbitAPI:
             현재가 정보 딕셔너리
         """
         if self.logger:
-            self.logger.debug(f"현재가 조회 시작 - 티커: {ticker_name}")
+            self.logger.debug("현재가 조회 시작 - 티커: %s", ticker_name)
             
-        url = f"{self.server_url}/v1/ticker"
+        path = "/v1/ticker"
         params = {'markets': ticker_name}
-        headers = self._get_auth_header(params)
-        
-        if self.logger:
-            self.logger.debug(f"API 요청 URL: {url}")
-            self.logger.debug(f"API 요청 파라미터: {params}")
             
         try:
-            response = requests.get(url, params=params, headers=headers)
-            
-            if self.logger:
-                self.logger.debug(f"API 응답 상태 코드: {response.status_code}")
-                
-            if response.status_code == 200:
-                result = response.json()
-                if result and len(result) > 0:
-                    return result[0]
-                else:
-                    raise Exception(f"현재가 조회 결과 없음 - 티커: {ticker_name}")
-            else:
-                return self._handle_api_error(f"현재가 조회 ({ticker_name})", response.status_code, response.text)
+            response = self._request('GET', path, params)
+            result = self._handle_response(response, f"현재가 조회 ({ticker_name})")
+            if response.status_code != 200:
+                return result
+            if not result:
+                raise Exception(f"현재가 조회 결과 없음 - 티커: {ticker_name}")
+            return result[0]
         except Exception as e:
             error_msg = f"현재가 조회 중 예외 발생: {str(e)}"
             if self.logger:
                 self.logger.error(error_msg)
             raise
 
+    def get_current_prices(self, markets: List[str]) -> List[Dict]:
+        """
+        여러 코인의 현재가를 한 번의 요청으로 조회
+        
+        Args:
+            markets: 코인 티커 리스트 (예: ['KRW-BTC', 'KRW-ETH'])
+            
+        Returns:
+            현재가 정보 리스트
+        """
+        path = "/v1/ticker"
+        params = {'markets': ','.join(markets)}
+        
+        try:
+            response = self._request('GET', path, params)
+            return self._handle_response(response, f"현재가 일괄 조회 ({params['markets']})")
+        except Exception as e:
+            error_msg = f"현재가 일괄 조회 중 예외 발생: {str(e)}"
+            if self.logger:
+                self.logger.error(error_msg)
+            raise
+
     def get_candles(self, market: str, interval: str = "1d", count: int = 200, to: Optional[str] = None) -> List[Dict]:
         """
         캔들 데이터 조회
@@ -138,15 +473,8 @@ class UpbitAPI:
             캔들 데이터 리스트
         """
         # 간격에 따른 엔드포인트 결정
-        if interval in ['1m', '3m', '5m', '15m', '30m', '1h', '4h']:
-            url = f"{self.server_url}/v1/candles/minutes/{interval.replace('m', '').replace('h', '60')}"
-        elif interval == '1d':
-            url = f"{self.server_url}/v1/candles/days"
-        elif interval == '1w':
-            url = f"{self.server_url}/v1/candles/weeks"
-        elif interval == '1M':
-            url = f"{self.server_url}/v1/candles/months"
-        else:
+        path = self.CANDLE_PATHS.get(interval)
+        if path is None:
             raise ValueError(f"지원하지 않는 간격: {interval}")
         
         params = {
@@ -157,15 +485,9 @@ class UpbitAPI:
         if to:
             params['to'] = to
             
-        headers = self._get_auth_header(params)
-        
         try:
-            response = requests.get(url, params=params, headers=headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return self._handle_api_error(f"캔들 데이터 조회 ({market}, {interval})", response.status_code, response.text)
+            response = self._request('GET', path, params)
+            return self._handle_response(response, f"캔들 데이터 조회 ({market}, {interval})")
         except Exception as e:
             error_msg = f"캔들 데이터 조회 중 예외 발생: {str(e)}"
             if self.logger:
@@ -189,11 +511,11 @@ class UpbitAPI:
         
         if self.logger:
             if side == "bid":
-                self.logger.info(f"{order_type} 주문 실행 시작 - 마켓: {market}, 타입: {order_type} 금액: {price} KRW")
+                self.logger.info("%s 주문 실행 시작 - 마켓: %s, 타입: %s 금액: %s KRW", order_type, market, order_type, price)
             else:
-                self.logger.info(f"{order_type} 주문 실행 시작 - 마켓: {market}, 타입: {order_type} 수량: {volume}")
+                self.logger.info("%s 주문 실행 시작 - 마켓: %s, 타입: %s 수량: %s", order_type, market, order_type, volume)
                 
-        url = f"{self.server_url}/v1/orders"
+        path = "/v1/orders"
         
         params = {
             'market': market,
@@ -212,26 +534,19 @@ class UpbitAPI:
                 if self.logger:
                     self.logger.error(error_msg)
                 raise ValueError(error_msg)
-            
-            if self.logger:
-                self.logger.debug(f"API 요청 URL: {url}")
-                self.logger.debug(f"API 요청 파라미터: {params}")
-                
-            headers = self._get_auth_header(params)
-            response = requests.post(url, json=params, headers=headers)
-            
-            if self.logger:
-                self.logger.debug(f"API 응답 상태 코드: {response.status_code}")
                 
+            response = self._request('POST', path, params, auth=True)
+            # 5xx 등 실패 응답이어도 주문이 체결됐을 수 있으므로 잔고 캐시는 항상 비움
+            self._balance_cache = None
+            result = self._handle_response(response, f"{order_type} 주문 ({market})", expected=201)
             if response.status_code == 201:
-                result = response.json()
                 if self.logger:
-                    self.logger.debug(f"{order_type} 주문 성공 - UUID: {result.get('uuid')}, 마켓: {result.get('market')}")
-                    self.logger.debug(f"주문 상세 정보: {result}")
-                return result
-            else:
-                return self._handle_api_error(f"{order_type} 주문 ({market})", response.status_code, response.text)
+                    self.logger.debug("%s 주문 성공 - UUID: %s, 마켓: %s", order_type, result.get('uuid'), result.get('market'))
+                    self.logger.debug("주문 상세 정보: %s", result)
+            return result
         except Exception as e:
+            # 타임아웃 등으로 응답을 못 받은 경우에도 주문이 접수됐을 수 있음
+            self._balance_cache = None
             error_msg = f"{order_type} 주문 중 예외 발생: {str(e)}"
             if self.logger:
                 self.logger.error(error_msg)
@@ -247,17 +562,12 @@ class UpbitAPI:
         Returns:
             주문 상태 딕셔너리
         """
-        url = f"{self.server_url}/v1/order"
+        path = "/v1/order"
         params = {'uuid': uuid}
-        headers = self._get_auth_header(params)
         
         try:
-            response = requests.get(url, params=params, headers=headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return self._handle_api_error(f"주문 상태 조회 ({uuid})", response.status_code, response.text)
+            response = self._request('GET', path, params, auth=True)
+            return self._handle_response(response, f"주문 상태 조회 ({uuid})")
         except Exception as e:
             error_msg = f"주문 상태 조회 중 예외 발생: {str(e)}"
             if self.logger:
@@ -274,17 +584,15 @@ class UpbitAPI:
         Returns:
             취소 결과 딕셔너리
         """
-        url = f"{self.server_url}/v1/order"
+        path = "/v1/order"
         params = {'uuid': uuid}
-        headers = self._get_auth_header(params)
         
         try:
-            response = requests.delete(url, params=params, headers=headers)
-            
+            response = self._request('DELETE', path, params, auth=True)
+            result = self._handle_response(response, f"주문 취소 ({uuid})")
             if response.status_code == 200:
-                return response.json()
-            else:
-                return self._handle_api_error(f"주문 취소 ({uuid})", response.status_code, response.text)
+                self._balance_cache = None
+            return result
         except Exception as e:
             error_msg = f"주문 취소 중 예외 발생: {str(e)}"
             if self.logger:
@@ -302,34 +610,22 @@ class UpbitAPI:
             대기 중인 주문 리스트
         """
             
-        url = f"{self.server_url}/v1/orders"
+        path = "/v1/orders"
         params = {'state': 'wait'}
         
         if market:
             params['market'] = market
             
-        headers = self._get_auth_header(params)
-        
-        if self.logger:
-            self.logger.debug(f"API 요청 URL: {url}")
-            self.logger.debug(f"API 요청 파라미터: {params}")
-            
         try:
-            response = requests.get(url, params=params, headers=headers)
-            
-            if self.logger:
-                self.logger.debug(f"API 응답 상태 코드: {response.status_code}")
-                
-            if response.status_code == 200:
-                result = response.json()
-                if self.logger:
-                    self.logger.info(f"대기 중인 주문 조회 성공 - 주문 수: {len(result)}")
-                    if result:
-                        for order in result:
-                            self.logger.debug(f"주문 정보: 마켓={order.get('market')}, UUID={order.get('uuid')}, 타입={order.get('side')}, 가격={order.get('price')}, 수량={order.get('volume')}")
-                return result
-            else:
-                return self._handle_api_error("대기 중인 주문 조회", response.status_code, response.text)
+            response = self._request('GET', path, params, auth=True)
+            result = self._handle_response(response, "대기 중인 주문 조회")
+            if response.status_code == 200 and self.logger:
+                self.logger.info("대기 중인 주문 조회 성공 - 주문 수: %s", len(result))
+                # 디버그 로그가 꺼져 있으면 주문별 루프 자체를 생략
+                if result and self.logger.isEnabledFor(logging.DEBUG):
+                    for order in result:
+                        self.logger.debug("주문 정보: 마켓=%s, UUID=%s, 타입=%s, 가격=%s, 수량=%s", order.get('market'), order.get('uuid'), order.get('side'), order.get('price'), order.get('volume'))
+            return result
         except Exception as e:
             error_msg = f"대기 중인 주문 조회 중 예외 발생: {str(e)}"
             if self.logger:
@@ -352,7 +648,7 @@ class UpbitAPI:
         Returns:
             종료된 주문 내역 리스트
         """
-        url = f"{self.server_url}/v1/orders"
+        path = "/v1/orders"
         params = {
             'market': market,
             'state': 'done',
@@ -363,72 +659,77 @@ class UpbitAPI:
         
         if to:
             params['to'] = to
-            
-        headers = self._get_auth_header(params)
         
         try:
-            response = requests.get(url, params=params, headers=headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return self._handle_api_error(f"종료된 주문 내역 조회 ({market})", response.status_code, response.text)
+            response = self._request('GET', path, params, auth=True)
+            return self._handle_response(response, f"종료된 주문 내역 조회 ({market})")
         except Exception as e:
             error_msg = f"종료된 주문 내역 조회 중 예외 발생: {str(e)}"
             if self.logger:
                 self.logger.error(error_msg)
             raise
     
-    def get_balances(self) -> List[Dict]:
+    def get_balances(self, force: bool = False) -> List[Dict]:
         """
         보유 자산 잔고 조회
         
+        balance_cache_ttl 초 이내의 재조회는 캐시된 결과를 반환하며,
+        주문 실행/취소 시 캐시가 무효화됨
+        
+        Args:
+            force: True이면 캐시를 무시하고 새로 조회
+        
         Returns:
             보유 자산 리스트
         """
-        url = f"{self.server_url}/v1/accounts"
-        headers = self._get_auth_header()
+        if not force and self._balance_cache is not None and time.monotonic() - self._balance_cache_time < self.balance_cache_ttl:
+            return self._balance_cache
         
-        if self.logger:
-            self.logger.debug(f"API 요청 URL: {url}")
+        path = "/v1/accounts"
             
         try:
-            response = requests.get(url, headers=headers)
-            
-            if self.logger:
-                self.logger.debug(f"API 응답 상태 코드: {response.status_code}")
-                
+            response = self._request('GET', path, auth=True)
+            result = self._handle_response(response, "보유 자산 잔고 조회")
             if response.status_code == 200:
-                result = response.json()
-                return result
-            else:
-                return self._handle_api_error("보유 자산 잔고 조회", response.status_code, response.text)
+                self._balance_cache = result
+                self._balance_cache_time = time.monotonic()
+            return result
         except Exception as e:
             error_msg = f"보유 자산 잔고 조회 중 예외 발생: {str(e)}"
             if self.logger:
                 self.logger.error(error_msg)
             raise
     
-    def get_market_info(self) -> List[Dict]:
+    def get_market_info(self, force: bool = False) -> List[Dict]:
         """
         KRW 마켓의 코인들만 필터링하여 제공
         
+        market_cache_ttl 초 동안은 캐시된 결과를 반환하여 호출마다 마켓 목록을 조회하지 않음
+        
+        Args:
+            force: True이면 캐시를 무시하고 새로 조회
+            
         Returns:
             마켓 정보 리스트
         """
-        url = f"{self.server_url}/v1/market/all"
+        now = time.monotonic()
+        if not force and self._market_info is not None and now - self._market_info_time < self.market_cache_ttl:
+            return self._market_info
+            
+        path = "/v1/market/all"
         params = {'isDetails': 'true'}
-        headers = self._get_auth_header(params)
         
         try:
-            response = requests.get(url, params=params, headers=headers)
-            
-            if response.status_code == 200:
-                markets = response.json()
-                # KRW 마켓만 필터링
-                return [market for market in markets if market['market'].startswith('KRW-')]
-            else:
-                return self._handle_api_error("마켓 정보 조회", response.status_code, response.text)
+            response = self._request('GET', path, params)
+            markets = self._handle_response(response, "마켓 정보 조회")
+            if response.status_code != 200:
+                return markets
+                
+            # KRW 마켓만 필터링 (슬라이스 비교가 startswith 호출보다 빠름)
+            market_info = [market for market in markets if market['market'][:4] == 'KRW-']
+            self._market_info = market_info
+            self._market_info_time = now
+            return market_info
         except Exception as e:
             error_msg = f"마켓 정보 조회 중 예외 발생: {str(e)}"
             if self.logger:
@@ -446,15 +747,49 @@ class UpbitAPI:
             str: 마켓의 한글 이름. 찾지 못한 경우 빈 문자열 반환
         """
         try:
-            market_list = self.get_market_info()
-            for market_info in market_list:
-                if market_info['market'] == market:
-                    return market_info['korean_name']
-            return ''
+            # 캐시된 {마켓 코드: 한글 이름} 딕셔너리에서 바로 조회
+            return self.get_market_name().get(market, '')
         except Exception as e:
             error_msg = f"마켓 이름 조회 중 예외 발생: {str(e)}"
             if self.logger:
                 self.logger.error(error_msg)
             return ''
    
-    
\ No newline at end of file
+    
+    
+    def get_market_name(self, force: bool = False) -> Dict[str, str]:
+        """
+        KRW 마켓 코드별 한글 이름 조회
+        
+        get_market_info 의 캐시를 공유하며, 마켓 목록이 갱신되었을 때만 딕셔너리를 다시 만듦
+        
+        Args:
+            force: True이면 캐시를 무시하고 새로 조회
+            
+        Returns:
+            {마켓 코드: 한글 이름} 딕셔너리
+        """
+        try:
+            markets = self.get_market_info(force)
+        except Exception:
+            # 갱신 실패 시 이전 결과가 있으면 계속 사용
+            if self._market_names is not None:
+                return self._market_names
+            raise
+            
+        # 조회 실패(빈 결과)는 캐시하지 않고 이전 결과가 있으면 계속 사용
+        if not markets:
+            return self._market_names or {}
+            
+        if markets is not self._market_names_source:
+            self._market_names = {market['market']: market['korean_name'] for market in markets}
+            self._market_names_source = markets
+        return self._market_names
+    
+    def invalidate_market_cache(self) -> None:
+        """
+        마켓 목록/한글 이름 캐시를 비워 다음 조회 시 새로 받아오도록 함
+        """
+        self._market_info = None
+        self._market_names = None
+        self._market_names_source = None
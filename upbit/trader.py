@@ -6,8 +6,9 @@ import time
 import schedule
 from datetime import datetime, timedelta
 import traceback
+from concurrent.futures import ThreadPoolExecutor, Future
 
-from upbit.api import UpbitAPI
+from upbit.api import UpbitAPI, UpbitFatalError
 from upbit.analyzer import UpbitAnalyzer
 
 
@@ -63,15 +64,22 @@ class UpbitTrader:
             'krw_balance': 0        # KRW 잔고
         }
 
-        # 타이머 초기화
+        # 타이머 초기화 (단조 시계 기준 초 단위)
+        started = time.monotonic()
         self.last_check_time = {
-            '10s': datetime.now(),
-            '1m': datetime.now(),
-            '5m': datetime.now()
+            '10s': started,
+            '1m': started,
+            '5m': started
         }
         
         # 초기 코인 정보를 BTC로 초기화
         self.top_volume_coins = {} 
+        
+        # 거래량 상위 코인 조회는 별도 스레드에서 실행 (손절 체크 지연 방지)
+        self._scan_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='volume-scan')
+        self._scan_future: Optional[Future] = None
+        # 마켓별 캔들 동시 조회 스레드 수
+        self.scan_workers = self.config.get('strategy.max_workers', 4)
 
         # 승률 관련 정보 초기화
         self.trading_stats = {
@@ -90,8 +98,8 @@ class UpbitTrader:
         schedule.every().day.at("21:52").do(self.dis_portfolio)
         schedule.every().day.at("00:00").do(self.reset_win_rate)
 
-        # 스케줄 실행
-        schedule.run_pending()
+        # 다음 스케줄 확인 시각 (메인 루프에서 도래 시에만 run_pending 호출)
+        self._next_schedule_time = time.monotonic()
         
         # 초기 승률 통계 출력
         self.log_win_rate()
@@ -104,11 +112,12 @@ class UpbitTrader:
             self.dis_portfolio()
             self.check_signal()
             
-            # 메인 루프
+            # 메인 루프 (1초 간격, 작업 시간만큼 대기 시간을 보정)
+            next_tick = time.monotonic()
             while True:
-                now = datetime.now()
+                now = time.monotonic()
                 
-                if (now - self.last_check_time['10s']).total_seconds() >= 10:
+                if now - self.last_check_time['10s'] >= 10:
                     self.last_check_time['10s'] = now
                     # 포지션 체크
                     self.check_position()
@@ -116,38 +125,62 @@ class UpbitTrader:
                     # 매수/매도 시그널 체크
                     self.check_signal()
                     
-                if (now - self.last_check_time['1m']).total_seconds() >= 60:
+                if now - self.last_check_time['1m'] >= 60:
                     self.last_check_time['1m'] = now
-                    self.get_top_volume_interval(interval="1m", count=2)
+                    # 이전 조회가 아직 진행 중이면 건너뜀
+                    if self._scan_future is None or self._scan_future.done():
+                        # 조회 스레드에서 발생한 치명적 오류는 메인 스레드에서 다시 발생시킴
+                        if self._scan_future is not None:
+                            self._scan_future.result()
+                        self._scan_future = self._scan_executor.submit(self.get_top_volume_interval, interval="1m", count=2)
                 
-                if (now - self.last_check_time['5m']).total_seconds() >= 300:
+                if now - self.last_check_time['5m'] >= 300:
                     self.last_check_time['5m'] = now
                     # 비정상 주문 취소
                     self.cancel_abnormal_orders()
+                
+                if now >= self._next_schedule_time:
+                    # 예약 작업 실행 (포트폴리오 알림, 승률 초기화)
+                    schedule.run_pending()
+                    idle_seconds = schedule.idle_seconds()
+                    # 벽시계 변경에 대비해 최대 60초마다 다시 확인
+                    self._next_schedule_time = now + (min(max(idle_seconds, 0), 60) if idle_seconds is not None else 60)
                     
-                # 잠시 대기
-                time.sleep(1)
+                # 다음 틱까지 남은 시간만 대기
+                next_tick += 1
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # 작업이 한 틱 이상 걸린 경우 밀린 틱을 몰아서 돌지 않도록 기준 재설정
+                    next_tick = time.monotonic()
                 
         except KeyboardInterrupt:
             self.logger.info("사용자에 의해 트레이더가 중지되었습니다.")
 
+        except UpbitFatalError:
+            raise
         except Exception as e:
             error_traceback = traceback.format_exc()
-            self.logger.error(f"트레이더 실행 중 오류 발생: {str(e)}\n{error_traceback}")
+            self.logger.error("트레이더 실행 중 오류 발생: %s\n%s", e, error_traceback)
+        
+        finally:
+            self._scan_executor.shutdown(wait=False)
+            self.api.close()
     
     def buy(self, market: str):
         
         try:
             # 이미 포지션이 있는 경우 매수하지 않음
             if self.position['market']:
-                self.logger.warning(f"이미 {self.position['market'] ( self.position['market_kr_name'] ) } 포지션이 있어 {market} 매수를 진행하지 않습니다.")
+                self.logger.warning("이미 %s(%s) 포지션이 있어 %s 매수를 진행하지 않습니다.", self.position['market'], self.position['market_kr_name'], market)
                 return
             
-            # 매수 금액 계산 (잔고의 90%, 수수료 고려)
-            buy_amount = self.position['krw_balance'] * 0.9
+            # 매수 금액 계산 (잔고의 90%, 수수료 고려, 원 단위 정수)
+            buy_amount = int(self.position['krw_balance']) * 9 // 10
 
             if buy_amount < 5000:  # 최소 주문 금액
-                self.logger.error(f"KRW 잔고 부족: {self.position['krw_balance']}원")
+                self.logger.error("KRW 잔고 부족: %s원", self.position['krw_balance'])
                 self.notifier.send_message("매수 오류\n" + f"KRW 잔고 부족: {self.position['krw_balance']}원")
                 return
                 
@@ -155,12 +188,14 @@ class UpbitTrader:
             order_result = self.api.run_order(market=market, side='bid', price=buy_amount)
             
             if not order_result or 'uuid' not in order_result:
-                self.logger.error(f"{market} 매수 주문 실패: {order_result}")
+                self.logger.error("%s 매수 주문 실패: %s", market, order_result)
                 self.notifier.send_message("매수 오류\n" + f"{market} 매수 주문 실패")
                 return
             
+        except UpbitFatalError:
+            raise
         except Exception as e:
-            self.logger.error(f"{market} 매수 중 오류 발생: {str(e)}")
+            self.logger.error("%s 매수 중 오류 발생: %s", market, e)
             self.notifier.send_message("매수 오류\n" + f"{market} 매수 중 오류 발생: {str(e)}")
     
     def sell(self, market: str):
@@ -168,26 +203,29 @@ class UpbitTrader:
         try:
             # 포지션 확인
             if not self.position['market'] or self.position['market'] != market:
-                self.logger.warning(f"{market} 포지션이 없어 매도를 진행하지 않습니다.")
+                self.logger.warning("%s 포지션이 없어 매도를 진행하지 않습니다.", market)
                 return
                 
             amount = self.position['amount']
             if amount <= 0:
-                self.logger.warning(f"{market} 보유 수량이 없습니다.")
+                self.logger.warning("%s 보유 수량이 없습니다.", market)
                 return
                 
             # 시장가 매도 주문
             order_result = self.api.run_order(market=market, side='ask', volume=amount)
             
             if not order_result or 'uuid' not in order_result:
-                self.logger.error(f"{market} 매도 주문 실패: {order_result}")
+                self.logger.error("%s 매도 주문 실패: %s", market, order_result)
                 return
              
             order_uuid = order_result['uuid']
             
-            # 주문 상태 확인 (최대 10초 대기)
-            for _ in range(10):
-                time.sleep(1)
+            # 주문 상태 확인 (0.05초부터 조회 간격을 1.5배씩 늘리며 최대 10초 대기, 간격은 최대 1초)
+            deadline = time.monotonic() + 10
+            delay = 0.05
+            while time.monotonic() < deadline:
+                time.sleep(delay)
+                delay = min(delay * 1.5, 1.0)
                 order_status = self.api.get_order_status(order_uuid)
                 
                 if order_status.get('state') == 'done':
@@ -254,7 +292,7 @@ class UpbitTrader:
                             holding_time_str += f"{minutes}분 "
                         holding_time_str += f"{seconds}초"
                         
-                        self.logger.critical(f"{market} 매도 완료 {emoji} 수익률: {profit_pct:.2f}% 보유시간: {holding_time_str} 실현손익: {realized_profit}원")
+                        self.logger.critical("%s 매도 완료 %s 수익률: %.2f%% 보유시간: %s 실현손익: %s원", market, emoji, profit_pct, holding_time_str, realized_profit)
                     # 로그에 수익률 계산 과정 기록
                     self.notifier.send_message(
                         f"{market}({self.api.get_market_name().get(market, market)}) 매도 완료\n{emoji} 수익률: {profit_pct:.2f}%\n보유시간: {holding_time_str}\n실현손익: {realized_profit:,}원\n현재 승률: {self.trading_stats['win_rate']:.2f}% ({self.trading_stats['wins']}승 {self.trading_stats['losses']}패)"
@@ -264,11 +302,13 @@ class UpbitTrader:
             
             # 10초 이내에 체결되지 않은 경우
             market_name = self.api.get_market_name().get(market, market)
-            self.logger.warning(f"{market}({market_name}) 매도 주문이 10초 이내에 체결되지 않았습니다.")
+            self.logger.warning("%s(%s) 매도 주문이 10초 이내에 체결되지 않았습니다.", market, market_name)
             self.notifier.send_message("매도 오류\n" + f"{market}({market_name}) 매도 주문이 10초 이내에 체결되지 않았습니다.")
 
+        except UpbitFatalError:
+            raise
         except Exception as e:
-            self.logger.error(f"{market} 매도 중 오류 발생: {str(e)}")
+            self.logger.error("%s 매도 중 오류 발생: %s", market, e)
             self.notifier.send_message("매도 오류\n" + f"{market} 매도 중 오류 발생: {str(e)}")
     
     def cancel_abnormal_orders(self, market: Optional[str] = None):
@@ -284,11 +324,13 @@ class UpbitTrader:
             for order in wait_orders:
                 uuid = order.get('uuid')
                 if uuid:
-                    self.logger.info(f"미체결 주문 취소: {order.get('market')} - {uuid}")
+                    self.logger.info("미체결 주문 취소: %s - %s", order.get('market'), uuid)
                     self.api.set_order_cancel(uuid)
                     
+        except UpbitFatalError:
+            raise
         except Exception as e:
-            self.logger.error(f"주문 취소 중 오류 발생: {str(e)}")
+            self.logger.error("주문 취소 중 오류 발생: %s", e)
     
     def check_signal(self):
         """
@@ -307,29 +349,23 @@ class UpbitTrader:
             # 포지션이 없는 경우 매수 시그널 체크
             # 변동율이 가장 높은 코인 가져오기
             try:
-                highest_change_coin = None
-                highest_change_rate = -100.0  # 초기값을 충분히 낮게 설정
-                
-                for market, coin_info in self.top_volume_coins.items():
-                    change_rate = coin_info.get('change_rate', 0)
-                    
-                    # 변동율이 더 높은 코인 찾기
-                    if change_rate > highest_change_rate:
-                        highest_change_rate = change_rate
-                        highest_change_coin = market
-                
-                if highest_change_coin:
+                # 조회 스레드가 교체하는 딕셔너리를 한 번만 참조
+                top_volume_coins = self.top_volume_coins
+                if top_volume_coins:
+                    highest_change_coin = max(top_volume_coins, key=lambda market: top_volume_coins[market].get('change_rate', 0))
+                    highest_change_rate = top_volume_coins[highest_change_coin].get('change_rate', 0)
                     market_korean_name = self.api.get_market_name().get(highest_change_coin, highest_change_coin)
-                    self.logger.info(f"변동율 최고 코인: {highest_change_coin}({market_korean_name}) - 변동율: {highest_change_rate:.2f}%")
+                    self.logger.info("변동율 최고 코인: %s(%s) - 변동율: %.2f%%", highest_change_coin, market_korean_name, highest_change_rate)
                     # 이전 마켓과 동일한 경우 매수 스킵
                     if highest_change_coin == self.position['before_market']:
-                        market_korean_name = self.api.get_market_name().get(highest_change_coin, highest_change_coin)
-                        self.logger.warning(f"이전 포지션과 동일한 {highest_change_coin}({market_korean_name})은 매수를 스킵합니다.")
+                        self.logger.warning("이전 포지션과 동일한 %s(%s)은 매수를 스킵합니다.", highest_change_coin, market_korean_name)
                     else:
                         self.buy(highest_change_coin)
                         self.check_position()
+            except UpbitFatalError:
+                raise
             except Exception as e:
-                self.logger.error(f"변동율 최고 코인 확인 중 오류 발생: {str(e)}")
+                self.logger.error("변동율 최고 코인 확인 중 오류 발생: %s", e)
             self.logger.info("=====================================")
         return
 
@@ -344,7 +380,7 @@ class UpbitTrader:
         try:
             # 잔고 조회
             balances = self.api.get_balances()
-            self.logger.info(f"잔고 조회: {balances}")
+            self.logger.info("잔고 조회: %s", balances)
 
             if len(balances) == 1 and balances[0]['currency'] == 'KRW':
                 # 기존에 다른 코인을 가지고 있었는지 확인
@@ -352,7 +388,7 @@ class UpbitTrader:
                     # 매도 처리
                     market_korean_name = self.api.get_market_name().get(self.position['market'], self.position['market'])
                     self.position['before_market'] = self.position['market']
-                    self.logger.info(f"기존 포지션 정리: {market_korean_name} > KRW") 
+                    self.logger.info("기존 포지션 정리: %s > KRW", market_korean_name) 
 
                 self.position['market'] = ''
                 self.position['entry_price'] = 0
@@ -367,6 +403,14 @@ class UpbitTrader:
                 return False 
 
             else: 
+                # 보유 코인 현재가 일괄 조회
+                markets = [f"KRW-{balance.get('currency')}" for balance in balances if balance.get('currency') != 'KRW']
+                # KRW 마켓이 없는 코인(소액 잔여/상장 폐지)이 섞이면 일괄 조회 전체가 실패하므로 유효한 마켓만 조회
+                market_names = self.api.get_market_name()
+                if market_names:
+                    markets = [market for market in markets if market in market_names]
+                tickers = {ticker['market']: ticker for ticker in self.api.get_current_prices(markets)} if markets else {}
+                
                 # 각 자산별 정보 계산
                 for balance in balances:
 
@@ -378,7 +422,7 @@ class UpbitTrader:
                         self.position['krw_balance'] = balance_amount
                     else:
                         market = f"KRW-{currency}"
-                        current_price_info = self.api.get_current_price(market)
+                        current_price_info = tickers.get(market, {})
                         current_price = float(current_price_info.get('trade_price', 0))
                         avg_buy_price = float(balance.get('avg_buy_price', 0))
                         
@@ -415,13 +459,15 @@ class UpbitTrader:
 
                             if current_price > self.position['top_price']:
                                 market_korean_name = self.api.get_market_name()[market]
-                                self.logger.critical(f"최고가 갱신: {market_korean_name} - {self.position['top_price']}원 -> {current_price}원 DIFF {current_price - self.position['top_price']}원")
+                                self.logger.critical("최고가 갱신: %s - %s원 -> %s원 DIFF %s원", market_korean_name, self.position['top_price'], current_price, current_price - self.position['top_price'])
                                 self.position['top_price'] = current_price
 
                 return True  # 매수 포지션 > 코인 보유
                     
+        except UpbitFatalError:
+            raise
         except Exception as e:
-            self.logger.error(f"포지션 체크 중 오류 발생: {str(e)}")
+            self.logger.error("포지션 체크 중 오류 발생: %s", e)
             return False  # 오류 발생 시 기본적으로 매도 포지션으로 간주
 
     def get_top_volume_interval(self, interval: str = "10min", count: int = 5):
@@ -430,24 +476,20 @@ class UpbitTrader:
         거래대금 기준 정렬 및 변동률 분석
         """
         start_time = datetime.now()
-        self.logger.debug(f"거래량 상위 코인 조회 시작: {start_time}")
+        self.logger.debug("거래량 상위 코인 조회 시작: %s", start_time)
         
         try:
             # 마켓 정보 조회
             markets = self.api.get_market_info()
-            self.logger.info(f"조회할 마켓 코드 목록: {markets}")
+            self.logger.info("조회할 마켓 코드 목록: %s", markets)
             market_codes = [market['market'] for market in markets]
             
-            # 거래량 정보 저장할 리스트
-            volume_data = []
-            
-            # 각 마켓별 거래량 조회
-            for market in market_codes:  
+            def fetch(market: str) -> Optional[Dict]:
                 try:
                     #candles = self.api.get_candles(market, interval="1m", count=10)
                     candles = self.api.get_candles(market, interval=interval, count=count)
                     if not candles:
-                        continue
+                        return None
                         
                     # 거래대금 합산
                     total_volume_krw = sum(float(candle['candle_acc_trade_price']) for candle in candles)
@@ -457,15 +499,21 @@ class UpbitTrader:
                     last_price = float(candles[0]['trade_price'])
                     price_change_pct = (last_price - first_price) / first_price * 100
                     
-                    volume_data.append({
+                    return {
                         'market': market,
                         'volume_krw': total_volume_krw,
                         'price_change_pct': price_change_pct,
                         'current_price': last_price
-                    })
-                    time.sleep(0.1)
+                    }
+                except UpbitFatalError:
+                    raise
                 except Exception as e:
-                    self.logger.error(f"{market} 거래량 조회 중 오류: {str(e)}")
+                    self.logger.error("%s 거래량 조회 중 오류: %s", market, e)
+                    return None
+            
+            # 각 마켓별 거래량 동시 조회 (요청 간격은 API 토큰 버킷이 조절)
+            with ThreadPoolExecutor(max_workers=self.scan_workers) as executor:
+                volume_data = [data for data in executor.map(fetch, market_codes) if data is not None]
             
             # 상위 10개 코인 저장
             # 거래량이 1억 이상인 코인만 필터링
@@ -474,36 +522,47 @@ class UpbitTrader:
             filtered_volume_data.sort(key=lambda x: x['price_change_pct'], reverse=True)
             # 상위 10개 코인만 선택
             top_10_coins = filtered_volume_data[:10]
+            # 상위 코인의 기술적 지표 일괄 계산 (일봉 기준)
+            metrics = self.analyzer.analyze_markets([data['market'] for data in top_10_coins])
 
-            # top_volume_coins 초기화 - 기존 데이터 삭제 후 새로운 데이터로 갱신
-            self.top_volume_coins = {}
+            # 새 딕셔너리에 채운 뒤 한 번에 교체 (메인 루프가 비어 있는 상태를 보지 않도록)
+            top_volume_coins = {}
             # 거래량 상위 코인 상세 정보 로깅
             if volume_data:
-                self.logger.info(f"===== 거래량 상위 코인 상세 정보 {interval} : {count} =====")
+                self.logger.info("===== 거래량 상위 코인 상세 정보 %s : %s =====", interval, count)
                 for idx, data in enumerate(top_10_coins, 1):
                     market_name = next((m['korean_name'] for m in markets if m['market'] == data['market']), data['market'])
                     change_emoji = "📈" if data['price_change_pct'] > 0 else "📉"
+                    market_metrics = metrics.get(data['market'], {})
                     self.logger.info(
                         f"{idx:2d}. {data['market']:10s} {market_name:15s} | "
                         f"거래대금: {data['volume_krw']:,.0f}원 | "
                         f"현재가: {data['current_price']:,.0f}원 | "
-                        f"{change_emoji} 변동률: {data['price_change_pct']:+.2f}%"
+                        f"{change_emoji} 변동률: {data['price_change_pct']:+.2f}% | "
+                        f"RSI: {market_metrics.get('rsi', float('nan')):.1f} | "
+                        f"MACD: {market_metrics.get('macd', float('nan')):,.2f}"
                     )
-                    self.top_volume_coins[data['market']] = {
+                    top_volume_coins[data['market']] = {
                         'korean_name': market_name,
                         'english_name': data['market'].split('-')[1],  
                         'trade_price': data['current_price'],
                         'volume': data['volume_krw'], 
-                        'change_rate': data['price_change_pct']
+                        'change_rate': data['price_change_pct'],
+                        'rsi': market_metrics.get('rsi'),
+                        'macd': market_metrics.get('macd'),
+                        'macd_signal': market_metrics.get('macd_signal')
                     }
     
                 self.logger.info("=====================================")
+            self.top_volume_coins = top_volume_coins
+        except UpbitFatalError:
+            raise
         except Exception as e:
-            self.logger.error(f"거래량 상위 코인 조회 중 오류 발생: {str(e)}")
+            self.logger.error("거래량 상위 코인 조회 중 오류 발생: %s", e)
         
         end_time = datetime.now()
         elapsed_time = (end_time - start_time).total_seconds()
-        self.logger.debug(f"거래량 상위 코인 조회 종료: {end_time}, 소요시간: {elapsed_time:.2f}초")
+        self.logger.debug("거래량 상위 코인 조회 종료: %s, 소요시간: %.2f초", end_time, elapsed_time)
 
     def dis_portfolio(self):
         """
@@ -532,8 +591,10 @@ class UpbitTrader:
             self.logger.info(summary)
             self.notifier.send_message(summary)
             
+        except UpbitFatalError:
+            raise
         except Exception as e:
-            self.logger.error(f"포트폴리오 분석 중 오류 발생: {str(e)}")
+            self.logger.error("포트폴리오 분석 중 오류 발생: %s", e)
 
 
 
@@ -563,7 +624,8 @@ class UpbitTrader:
         """
         stats = self.trading_stats
         self.logger.info(
-            f"📊 트레이딩 승률: {stats['win_rate']:.2f}% ({stats['wins']}승 {stats['losses']}패, 총 {stats['total_trades']}건)"
+            "📊 트레이딩 승률: %.2f%% (%s승 %s패, 총 %s건)",
+            stats['win_rate'], stats['wins'], stats['losses'], stats['total_trades']
         )
     
     def reset_win_rate(self):
@@ -587,7 +649,8 @@ class UpbitTrader:
         # 전날 통계 로그 및 알림
         if yesterday_stats['total_trades'] > 0:
             self.logger.critical(
-                f"🔄 일일 승률 초기화! 어제 승률: {yesterday_stats['win_rate']:.2f}% ({yesterday_stats['wins']}승 {yesterday_stats['losses']}패, 총 {yesterday_stats['total_trades']}건)"
+                "🔄 일일 승률 초기화! 어제 승률: %.2f%% (%s승 %s패, 총 %s건)",
+                yesterday_stats['win_rate'], yesterday_stats['wins'], yesterday_stats['losses'], yesterday_stats['total_trades']
             )
             self.notifier.send_message(
                 f"🔄 일일 승률 초기화!\n어제 승률: {yesterday_stats['win_rate']:.2f}%\n{yesterday_stats['wins']}승 {yesterday_stats['losses']}패 (총 {yesterday_stats['total_trades']}건)"
@@ -65,6 +65,10 @@ class TelegramNotifier:
         # 조용한 시간 설정
         self.quiet_start = config.get('telegram.quiet_hours.start', '22:00')
         self.quiet_end = config.get('telegram.quiet_hours.end', '08:00')
+        
+        # 메시지 전송마다 파싱하지 않도록 시간 객체로 미리 변환
+        self._quiet_start_time = datetime.datetime.strptime(self.quiet_start, '%H:%M').time()
+        self._quiet_end_time = datetime.datetime.strptime(self.quiet_end, '%H:%M').time()
 
     def _is_quiet_time(self) -> bool:
         """
@@ -78,10 +82,8 @@ class TelegramNotifier:
             return False
             
         now = datetime.datetime.now().time()
-        
-        # 시간 문자열을 datetime.time 객체로 변환
-        quiet_start = datetime.datetime.strptime(self.quiet_start, '%H:%M').time()
-        quiet_end = datetime.datetime.strptime(self.quiet_end, '%H:%M').time()
+        quiet_start = self._quiet_start_time
+        quiet_end = self._quiet_end_time
         
         if quiet_start > quiet_end:
             return now >= quiet_start or now <= quiet_end